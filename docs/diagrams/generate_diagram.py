@@ -7,23 +7,46 @@ using the diagrams library (https://diagrams.mingrammer.com/).
 
 Requirements:
     pip install diagrams
+    oxipng (optional) - losslessly shrinks PNG output when found on PATH
 
 Usage:
     python generate_diagram.py
+    python generate_diagram.py --freeze
+    
+    SVG is rendered by default since it skips Graphviz's rasterizer. Set
+    DIAGRAM_OUTFORMAT=png to regenerate the PNGs embedded in the README.
 
 Output:
-    - acs_architecture.png (main architecture)
-    - acs_landing_zone.png (landing zone view)
-    - acs_data_flow.png (data flow diagram)
+    - acs_architecture.svg (main architecture)
+    - acs_landing_zone.svg (landing zone view)
+    - acs_data_flow.svg (data flow diagram)
+
+The diagrams are independent, so they are rendered in parallel worker
+processes. Each image gets a ``.sig`` sidecar holding a hash of the code that
+produced it; diagrams whose definition has not changed are not re-rendered.
+
+--freeze saves each diagram's Graphviz source as acs_*.dot. While a frozen
+file is newer than this script, images are rendered from it by calling `dot`
+directly, skipping graph construction in Python. Frozen files reference the
+local diagrams icon directory, so they are build artefacts, not sources.
 """
 
+import argparse
+import hashlib
+import inspect
+import os
+import shutil
+import subprocess
+from concurrent.futures import ProcessPoolExecutor
+from importlib.metadata import version
+
 from diagrams import Diagram, Cluster, Edge
 from diagrams.azure.compute import AppServices, FunctionApps
 from diagrams.azure.database import CosmosDb, BlobStorage
 from diagrams.azure.integration import EventGridDomains
 from diagrams.azure.security import KeyVaults
 from diagrams.azure.identity import ManagedIdentities, ActiveDirectory
-from diagrams.azure.network import VirtualNetworks, Subnets, NetworkSecurityGroupsClassic
+from diagrams.azure.network import VirtualNetworks
 from diagrams.azure.monitor import Monitor, ApplicationInsights
 from diagrams.azure.general import Resourcegroups
 from diagrams.onprem.client import Users, Client
@@ -46,14 +69,83 @@ edge_attr = {
     "fontsize": "10",
 }
 
+# Output format for all diagrams ("svg" or "png")
+OUTFORMAT = os.environ.get("DIAGRAM_OUTFORMAT", "svg")
+
+
+def _render_signature(fn):
+    """Hash a diagram's definition, the shared styling and the library version."""
+    payload = "\n".join((
+        inspect.getsource(fn),
+        repr((graph_attr, node_attr, edge_attr)),
+        version("diagrams"),
+    ))
+    return hashlib.md5(payload.encode("utf-8"), usedforsecurity=False).hexdigest()
+
+
+def _optimize_png(path):
+    """Recompress a PNG and strip Graphviz metadata chunks, if oxipng is available."""
+    if shutil.which("oxipng"):
+        subprocess.run(["oxipng", "-o", "4", "--strip", "safe", path], check=False)
+
+
+def _render_frozen(out_path):
+    """
+    Render an image straight from its frozen DOT file.
+    
+    Returns:
+        True if Graphviz rendered the image, False if no usable frozen file exists
+    """
+    dot_path = f"{os.path.splitext(out_path)[0]}.dot"
+    if not (os.path.exists(dot_path) and shutil.which("dot")):
+        return False
+    if os.path.getmtime(dot_path) <= os.path.getmtime(__file__):
+        return False
+    
+    outformat = os.path.splitext(out_path)[1].lstrip(".")
+    result = subprocess.run(
+        ["dot", f"-T{outformat}", dot_path, "-o", out_path], check=False
+    )
+    return result.returncode == 0
+
+
+def _cached_render(fn, out_path):
+    """
+    Render a diagram unless an up-to-date image already exists.
+    
+    Args:
+        fn: One of the ``create_*`` diagram functions
+        out_path: Image file the function writes
+    
+    Returns:
+        True if the diagram was rendered, False if the cached image was kept
+    """
+    signature = _render_signature(fn)
+    sig_path = f"{out_path}.sig"
+    
+    if os.path.exists(out_path) and os.path.exists(sig_path):
+        with open(sig_path, encoding="utf-8") as f:
+            if f.read().strip() == signature:
+                return False
+    
+    if not _render_frozen(out_path):
+        fn()
+    if out_path.endswith(".png"):
+        _optimize_png(out_path)
+    
+    with open(sig_path, "w", encoding="utf-8") as f:
+        f.write(signature)
+    return True
 
-def create_main_architecture():
+
+def create_main_architecture(outformat=OUTFORMAT):
     """Generate the main architecture diagram."""
     
     with Diagram(
         "Azure Communication Services - Enterprise Architecture",
         filename="acs_architecture",
         show=False,
+        outformat=outformat,
         direction="TB",
         graph_attr=graph_attr,
         node_attr=node_attr,
@@ -94,8 +186,7 @@ def create_main_architecture():
                 app_insights = ApplicationInsights("Application\nInsights")
         
         # Client to Application tier connections
-        web_app >> Edge(label="HTTPS") >> app_service
-        mobile_app >> Edge(label="HTTPS") >> app_service
+        [web_app, mobile_app] >> Edge(label="HTTPS") >> app_service
         bot >> Edge(label="HTTPS") >> functions
         
         # Application to ACS
@@ -106,29 +197,29 @@ def create_main_architecture():
         acs >> Edge(label="Events") >> event_grid
         event_grid >> Edge(label="Trigger") >> functions
         
-        # Security connections
-        app_service >> Edge(style="dashed") >> key_vault
-        functions >> Edge(style="dashed") >> key_vault
-        app_service >> Edge(style="dashed") >> managed_id
-        functions >> Edge(style="dashed") >> managed_id
+        # Security connections (one edge style shared by every secret/identity link)
+        secured = Edge(style="dashed")
+        for src in (app_service, functions):
+            src >> secured >> [key_vault, managed_id]
         
         # Data connections
         functions >> Edge(label="Store") >> cosmos_db
         acs >> Edge(label="Recordings") >> blob_storage
         
         # Monitoring connections
-        acs >> Edge(style="dotted", color="gray") >> log_analytics
-        app_service >> Edge(style="dotted", color="gray") >> app_insights
-        functions >> Edge(style="dotted", color="gray") >> app_insights
+        telemetry = Edge(style="dotted", color="gray")
+        acs >> telemetry >> log_analytics
+        [app_service, functions] >> telemetry >> app_insights
 
 
-def create_landing_zone_diagram():
+def create_landing_zone_diagram(outformat=OUTFORMAT):
     """Generate the Azure Landing Zone integration diagram."""
     
     with Diagram(
         "Azure Communication Services - Landing Zone Integration",
         filename="acs_landing_zone",
         show=False,
+        outformat=outformat,
         direction="TB",
         graph_attr=graph_attr,
     ):
@@ -139,16 +230,16 @@ def create_landing_zone_diagram():
             # Connectivity Subscription
             with Cluster("Connectivity Subscription"):
                 hub_vnet = VirtualNetworks("Hub VNet")
-                nsg_hub = NetworkSecurityGroupsClassic("Hub NSG")
             
             # Identity Subscription
+            # (kept without edges so the subscription still renders)
             with Cluster("Identity Subscription"):
-                entra = ActiveDirectory("Entra ID")
+                ActiveDirectory("Entra ID")
             
             # Management Subscription
             with Cluster("Management Subscription"):
                 monitor = Monitor("Azure Monitor")
-                log_analytics = ApplicationInsights("Log Analytics\nWorkspace")
+                log_analytics = Monitor("Log Analytics\nWorkspace")
             
             # Landing Zone - Application
             with Cluster("Landing Zone - ACS Application"):
@@ -156,15 +247,12 @@ def create_landing_zone_diagram():
                     spoke_vnet = VirtualNetworks("Spoke VNet")
                     
                     with Cluster("Application Subnet"):
-                        app_snet = Subnets("App Subnet")
                         app_svc = AppServices("App Service")
                     
                     with Cluster("Integration Subnet"):
-                        int_snet = Subnets("Integration Subnet")
                         functions = FunctionApps("Functions")
                     
                     with Cluster("Data Subnet"):
-                        data_snet = Subnets("Data Subnet")
                         cosmos = CosmosDb("Cosmos DB")
                 
                 # ACS (Region-agnostic)
@@ -175,29 +263,29 @@ def create_landing_zone_diagram():
         users >> hub_vnet
         hub_vnet >> spoke_vnet
         
-        app_svc >> acs
-        functions >> acs
-        
-        app_svc >> kv
-        functions >> kv
+        app_svc >> [acs, kv, cosmos]
+        functions >> [acs, kv, cosmos]
         
-        app_svc >> cosmos
-        functions >> cosmos
-        
-        acs >> Edge(style="dotted") >> log_analytics
-        app_svc >> Edge(style="dotted") >> monitor
+        telemetry = Edge(style="dotted")
+        acs >> telemetry >> log_analytics
+        app_svc >> telemetry >> monitor
 
 
-def create_data_flow_diagram():
+def create_data_flow_diagram(outformat=OUTFORMAT):
     """Generate the data flow diagram."""
     
     with Diagram(
         "Azure Communication Services - Data Flow",
         filename="acs_data_flow",
         show=False,
+        outformat=outformat,
         direction="LR",
-        graph_attr=graph_attr,
+        # newrank lets the rank=same hints below apply inside clusters
+        graph_attr={**graph_attr, "nodesep": "0.3", "ranksep": "0.5", "newrank": "true"},
     ):
+        # Sibling nodes share a rank so dot does not search for their order
+        same_rank = {"rank": "same"}
+        
         with Cluster("1. User Initiates"):
             user = Users("User")
             web = React("Web/Mobile App")
@@ -208,7 +296,7 @@ def create_data_flow_diagram():
         
         with Cluster("3. Communication"):
             acs = Resourcegroups("ACS")
-            with Cluster("Capabilities"):
+            with Cluster("Capabilities", graph_attr=same_rank):
                 voice = Client("Voice")
                 video = Mobile("Video")
                 chat = Tablet("Chat")
@@ -217,7 +305,7 @@ def create_data_flow_diagram():
             events = EventGridDomains("Event Grid")
             functions = FunctionApps("Functions")
         
-        with Cluster("5. Storage"):
+        with Cluster("5. Storage", graph_attr=same_rank):
             cosmos = CosmosDb("Chat History")
             blob = BlobStorage("Recordings")
         
@@ -230,31 +318,69 @@ def create_data_flow_diagram():
         entra >> Edge(label="3. Token") >> token
         token >> Edge(label="4. Connect") >> acs
         
-        acs >> voice
-        acs >> video
-        acs >> chat
+        acs >> [voice, video, chat]
         
         acs >> Edge(label="5. Events") >> events
         events >> Edge(label="6. Process") >> functions
         functions >> Edge(label="7. Store") >> cosmos
         acs >> Edge(label="8. Record") >> blob
         
-        acs >> Edge(style="dotted", label="9. Telemetry") >> insights
+        # Telemetry is a side channel; keep it out of the rank assignment
+        acs >> Edge(style="dotted", label="9. Telemetry", constraint="false") >> insights
 
 
-if __name__ == "__main__":
-    print("Generating Azure Communication Services architecture diagrams...")
+DIAGRAMS = (
+    ("main architecture", create_main_architecture, f"acs_architecture.{OUTFORMAT}"),
+    ("landing zone", create_landing_zone_diagram, f"acs_landing_zone.{OUTFORMAT}"),
+    ("data flow", create_data_flow_diagram, f"acs_data_flow.{OUTFORMAT}"),
+)
+
+
+def freeze():
+    """Save the Graphviz DOT source of every diagram."""
+    print("Freezing Azure Communication Services diagram sources...")
     
-    print("  → Creating main architecture diagram...")
-    create_main_architecture()
+    with ProcessPoolExecutor(max_workers=len(DIAGRAMS)) as pool:
+        futures = [pool.submit(fn, "dot") for _, fn, _ in DIAGRAMS]
+        for future in futures:
+            future.result()
     
-    print("  → Creating landing zone diagram...")
-    create_landing_zone_diagram()
+    print("\n✅ DOT sources frozen:")
+    for _, _, out_path in DIAGRAMS:
+        print(f"   - {os.path.splitext(out_path)[0]}.dot")
+
+
+def generate():
+    """Render every diagram that is missing or out of date."""
+    print("Generating Azure Communication Services architecture diagrams...")
     
-    print("  → Creating data flow diagram...")
-    create_data_flow_diagram()
+    # Each diagram spawns its own Graphviz process; use worker processes
+    # rather than threads since `diagrams` keeps the active graph in
+    # process-global state.
+    with ProcessPoolExecutor(max_workers=len(DIAGRAMS)) as pool:
+        futures = []
+        for label, fn, out_path in DIAGRAMS:
+            print(f"  → Creating {label} diagram...")
+            futures.append((out_path, pool.submit(_cached_render, fn, out_path)))
+        
+        for out_path, future in futures:
+            if not future.result():
+                print(f"    {out_path} is up to date, skipped")
     
     print("\n✅ Diagrams generated successfully!")
-    print("   - acs_architecture.png")
-    print("   - acs_landing_zone.png")
-    print("   - acs_data_flow.png")
+    for _, _, out_path in DIAGRAMS:
+        print(f"   - {out_path}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Generate the ACS architecture diagrams.")
+    parser.add_argument(
+        "--freeze",
+        action="store_true",
+        help="save each diagram's DOT source so later runs can skip graph construction",
+    )
+    
+    if parser.parse_args().freeze:
+        freeze()
+    else:
+        generate()
@@ -17,20 +17,36 @@ Configuration:
     - ACS_CONNECTION_STRING: ACS connection string from Key Vault
     - ACS_ENDPOINT: ACS endpoint URL
     - AZURE_TENANT_ID: Entra ID tenant ID (for managed identity)
+
+SDK packages are imported when the service that needs them is created, so a
+process that only sends email (e.g. a Function) only pays for the email SDK.
 """
 
+from __future__ import annotations
+
 import os
+import asyncio
 import logging
+from functools import lru_cache
 from datetime import timedelta
-from typing import Optional, List, Dict, Any
+from typing import TYPE_CHECKING, Optional, List, Dict, Any, Iterator
 from dataclasses import dataclass
-from azure.identity import DefaultAzureCredential
-from azure.communication.identity import CommunicationIdentityClient, CommunicationUserIdentifier
-from azure.communication.sms import SmsClient
-from azure.communication.chat import ChatClient, CommunicationTokenCredential
-from azure.communication.email import EmailClient
 from azure.core.exceptions import HttpResponseError
 
+if TYPE_CHECKING:
+    from azure.identity import DefaultAzureCredential
+    from azure.identity.aio import DefaultAzureCredential as AsyncDefaultAzureCredential
+    from azure.communication.identity import CommunicationUserIdentifier
+    from azure.communication.sms.aio import SmsClient as AsyncSmsClient
+    from azure.communication.chat import ChatThreadClient
+    from azure.communication.chat.aio import (
+        ChatClient as AsyncChatClient,
+        ChatThreadClient as AsyncChatThreadClient
+    )
+    from azure.communication.email.aio import EmailClient as AsyncEmailClient
+    from azure.core.pipeline.transport import RequestsTransport
+    from requests import Session
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -38,8 +54,89 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Shared default for optional recipient lists (avoids a new list per call)
+_EMPTY: tuple = ()
+
+
+@lru_cache(maxsize=1)
+def _shared_credential() -> DefaultAzureCredential:
+    """Return the process-wide credential so all clients share one token cache."""
+    from azure.identity import DefaultAzureCredential
+    return DefaultAzureCredential()
+
+
+@lru_cache(maxsize=1)
+def _shared_async_credential() -> AsyncDefaultAzureCredential:
+    """
+    Return the process-wide async credential for the ``*_async`` methods.
+    
+    The async credential binds to the event loop it is first used on. Close it
+    with aclose_shared_credential() before that loop ends; the next call then
+    creates a fresh credential for the new loop.
+    """
+    from azure.identity.aio import DefaultAzureCredential as AsyncDefaultAzureCredential
+    return AsyncDefaultAzureCredential()
+
+
+async def aclose_shared_credential() -> None:
+    """
+    Close the shared async credential and forget it.
+    
+    Call after the services' aclose(), at the end of each event loop
+    (e.g. the coroutine passed to asyncio.run()), so the credential's HTTP
+    session is not leaked.
+    """
+    if _shared_async_credential.cache_info().currsize:
+        credential = _shared_async_credential()
+        _shared_async_credential.cache_clear()
+        await credential.close()
+
+
+@lru_cache(maxsize=1)
+def _shared_session() -> Session:
+    """Return the process-wide HTTP session so all clients share one connection pool."""
+    from requests import Session
+    from requests.adapters import HTTPAdapter
+    
+    session = Session()
+    adapter = HTTPAdapter(pool_connections=50, pool_maxsize=100)
+    session.mount("https://", adapter)
+    return session
+
+
+def _shared_transport() -> RequestsTransport:
+    """Build a transport over the shared session; closing a client leaves the session open."""
+    from azure.core.pipeline.transport import RequestsTransport
+    return RequestsTransport(session=_shared_session(), session_owner=False)
+
+
+def _build_client(client_cls, config: "ACSConfig"):
+    """
+    Build a sync ACS client from configuration.
+    
+    Managed identity is preferred; the connection string is the fallback.
+    Every client shares the process-wide credential and connection pool.
+    """
+    transport = _shared_transport()
+    if config.use_managed_identity:
+        client = client_cls(config.endpoint, _shared_credential(), transport=transport)
+        logger.info("%s initialized with managed identity", client_cls.__name__)
+    else:
+        client = client_cls.from_connection_string(
+            config.connection_string, transport=transport
+        )
+        logger.info("%s initialized with connection string", client_cls.__name__)
+    return client
+
+
+def _build_async_client(client_cls, config: "ACSConfig"):
+    """Build an aio ACS client from configuration, mirroring _build_client."""
+    if config.use_managed_identity:
+        return client_cls(config.endpoint, _shared_async_credential())
+    return client_cls.from_connection_string(config.connection_string)
 
-@dataclass
+
+@dataclass(slots=True)
 class ACSConfig:
     """Configuration for Azure Communication Services."""
     endpoint: str
@@ -64,19 +161,10 @@ class ACSIdentityService:
         Args:
             config: ACS configuration object
         """
-        self.config = config
+        from azure.communication.identity import CommunicationIdentityClient
         
-        if config.use_managed_identity:
-            # Preferred: Use managed identity for secure authentication
-            credential = DefaultAzureCredential()
-            self.client = CommunicationIdentityClient(config.endpoint, credential)
-            logger.info("Identity client initialized with managed identity")
-        else:
-            # Fallback: Use connection string
-            self.client = CommunicationIdentityClient.from_connection_string(
-                config.connection_string
-            )
-            logger.info("Identity client initialized with connection string")
+        self.config = config
+        self.client = _build_client(CommunicationIdentityClient, config)
     
     def create_user(self) -> CommunicationUserIdentifier:
         """
@@ -87,10 +175,10 @@ class ACSIdentityService:
         """
         try:
             user = self.client.create_user()
-            logger.info(f"Created user: {user.properties['id']}")
+            logger.info("Created user: %s", user.properties['id'])
             return user
         except HttpResponseError as e:
-            logger.error(f"Failed to create user: {e}")
+            logger.error("Failed to create user: %s", e)
             raise
     
     def create_user_with_token(
@@ -119,10 +207,10 @@ class ACSIdentityService:
                 scopes=scopes,
                 token_expires_in=token_expires_in
             )
-            logger.info(f"Created user with token, expires: {token_response.expires_on}")
+            logger.info("Created user with token, expires: %s", token_response.expires_on)
             return user, token_response
         except HttpResponseError as e:
-            logger.error(f"Failed to create user with token: {e}")
+            logger.error("Failed to create user with token: %s", e)
             raise
     
     def get_token(
@@ -145,13 +233,13 @@ class ACSIdentityService:
         
         try:
             token_response = self.client.get_token(user, scopes=scopes)
-            logger.info(f"Token issued for user, expires: {token_response.expires_on}")
+            logger.info("Token issued for user, expires: %s", token_response.expires_on)
             return {
                 "token": token_response.token,
                 "expires_on": token_response.expires_on.isoformat()
             }
         except HttpResponseError as e:
-            logger.error(f"Failed to get token: {e}")
+            logger.error("Failed to get token: %s", e)
             raise
     
     def revoke_tokens(self, user: CommunicationUserIdentifier) -> None:
@@ -163,9 +251,9 @@ class ACSIdentityService:
         """
         try:
             self.client.revoke_tokens(user)
-            logger.info(f"Tokens revoked for user: {user.properties['id']}")
+            logger.info("Tokens revoked for user: %s", user.properties['id'])
         except HttpResponseError as e:
-            logger.error(f"Failed to revoke tokens: {e}")
+            logger.error("Failed to revoke tokens: %s", e)
             raise
     
     def delete_user(self, user: CommunicationUserIdentifier) -> None:
@@ -177,9 +265,9 @@ class ACSIdentityService:
         """
         try:
             self.client.delete_user(user)
-            logger.info(f"Deleted user: {user.properties['id']}")
+            logger.info("Deleted user: %s", user.properties['id'])
         except HttpResponseError as e:
-            logger.error(f"Failed to delete user: {e}")
+            logger.error("Failed to delete user: %s", e)
             raise
 
 
@@ -200,15 +288,20 @@ class ACSSmsService:
         Args:
             config: ACS configuration object
         """
+        from azure.communication.sms import SmsClient
+        
         self.config = config
+        self.client = _build_client(SmsClient, config)
         
-        if config.use_managed_identity:
-            credential = DefaultAzureCredential()
-            self.client = SmsClient(config.endpoint, credential)
-            logger.info("SMS client initialized with managed identity")
-        else:
-            self.client = SmsClient.from_connection_string(config.connection_string)
-            logger.info("SMS client initialized with connection string")
+        # Async client is only built when an *_async method is first used
+        self._async_client = None
+    
+    def _get_async_client(self) -> AsyncSmsClient:
+        """Get or create the async SMS client."""
+        if self._async_client is None:
+            from azure.communication.sms.aio import SmsClient as AsyncSmsClient
+            self._async_client = _build_async_client(AsyncSmsClient, self.config)
+        return self._async_client
     
     def send_sms(
         self,
@@ -241,7 +334,7 @@ class ACSSmsService:
             )
             
             result = response[0]
-            logger.info(f"SMS sent: {result.message_id}, to: {to_number}")
+            logger.info("SMS sent: %s, to: %s", result.message_id, to_number)
             
             return {
                 "message_id": result.message_id,
@@ -250,9 +343,61 @@ class ACSSmsService:
                 "http_status": result.http_status_code
             }
         except HttpResponseError as e:
-            logger.error(f"Failed to send SMS: {e}")
+            logger.error("Failed to send SMS: %s", e)
             raise
     
+    async def send_sms_async(
+        self,
+        from_number: str,
+        to_number: str,
+        message: str,
+        enable_delivery_report: bool = True,
+        tag: str = None
+    ) -> Dict[str, Any]:
+        """
+        Send an SMS message without blocking the event loop.
+        
+        Takes the same arguments and returns the same result as send_sms.
+        """
+        try:
+            response = await self._get_async_client().send(
+                from_=from_number,
+                to=to_number,
+                message=message,
+                enable_delivery_report=enable_delivery_report,
+                tag=tag
+            )
+            
+            result = response[0]
+            logger.info("SMS sent: %s, to: %s", result.message_id, to_number)
+            
+            return {
+                "message_id": result.message_id,
+                "to": result.to,
+                "successful": result.successful,
+                "http_status": result.http_status_code
+            }
+        except HttpResponseError as e:
+            logger.error("Failed to send SMS: %s", e)
+            raise
+    
+    async def send_many(self, messages: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Send several independent SMS messages concurrently.
+        
+        When the loop is done, close the service and the shared credential:
+        ``await service.aclose(); await aclose_shared_credential()``.
+        
+        Args:
+            messages: List of send_sms_async keyword-argument dicts
+        
+        Returns:
+            List of send results, in the same order as messages
+        """
+        return list(await asyncio.gather(
+            *(self.send_sms_async(**m) for m in messages)
+        ))
+    
     def send_bulk_sms(
         self,
         from_number: str,
@@ -280,19 +425,45 @@ class ACSSmsService:
                 enable_delivery_report=enable_delivery_report
             )
             
-            results = []
-            for result in responses:
-                results.append({
+            results = [
+                {
                     "message_id": result.message_id,
                     "to": result.to,
                     "successful": result.successful
-                })
-                logger.info(f"Bulk SMS: {result.message_id} -> {result.to}")
+                }
+                for result in responses
+            ]
+            
+            # Per-recipient detail only at DEBUG; large sends log one summary line
+            if logger.isEnabledFor(logging.DEBUG):
+                for result in results:
+                    logger.debug("Bulk SMS: %s -> %s", result["message_id"], result["to"])
+            logger.info("Bulk SMS: %d sent", len(results))
             
             return results
         except HttpResponseError as e:
-            logger.error(f"Failed to send bulk SMS: {e}")
+            logger.error("Failed to send bulk SMS: %s", e)
             raise
+    
+    async def aclose(self) -> None:
+        """Close the async client, if one was created."""
+        if self._async_client is not None:
+            await self._async_client.close()
+            self._async_client = None
+
+
+def _message_to_dict(message) -> Dict[str, Any]:
+    """Convert a ChatMessage into the dict shape returned by the chat service."""
+    content = message.content
+    sender = message.sender_communication_identifier
+    created_on = message.created_on
+    return {
+        "id": message.id,
+        "type": message.type,
+        "content": content.message if content else None,
+        "sender_id": sender.properties.get('id') if sender else None,
+        "created_on": created_on.isoformat() if created_on else None
+    }
 
 
 class ACSChatService:
@@ -314,13 +485,62 @@ class ACSChatService:
             endpoint: ACS endpoint URL
             token: User access token
         """
+        from azure.communication.chat import (
+            ChatClient,
+            ChatParticipant,
+            CommunicationTokenCredential,
+            CommunicationUserIdentifier
+        )
+        
         self.endpoint = endpoint
+        self._token = token
+        # Bound once here so create_thread/add_participant need no imports
+        self._participant_cls = ChatParticipant
+        self._identifier_cls = CommunicationUserIdentifier
         self.client = ChatClient(
             endpoint,
-            CommunicationTokenCredential(token)
+            CommunicationTokenCredential(token),
+            transport=_shared_transport()
         )
+        self._async_client = None
+        # Thread clients each carry their own pipeline; build one per thread
+        self._thread_clients: Dict[str, ChatThreadClient] = {}
+        self._async_thread_clients: Dict[str, AsyncChatThreadClient] = {}
         logger.info("Chat client initialized")
     
+    def _get_async_client(self) -> AsyncChatClient:
+        """Get or create the async chat client."""
+        if self._async_client is None:
+            from azure.communication.chat.aio import (
+                ChatClient as AsyncChatClient,
+                CommunicationTokenCredential as AsyncCommunicationTokenCredential
+            )
+            
+            self._async_client = AsyncChatClient(
+                self.endpoint,
+                AsyncCommunicationTokenCredential(self._token)
+            )
+        return self._async_client
+    
+    def _get_thread_client(self, thread_id: str) -> ChatThreadClient:
+        """Get the cached client for a thread, creating it on first use."""
+        thread_client = self._thread_clients.get(thread_id)
+        if thread_client is None:
+            thread_client = self._thread_clients.setdefault(
+                thread_id,
+                self.client.get_chat_thread_client(thread_id, transport=_shared_transport())
+            )
+        return thread_client
+    
+    def _get_async_thread_client(self, thread_id: str) -> AsyncChatThreadClient:
+        """Get the cached async client for a thread, creating it on first use."""
+        thread_client = self._async_thread_clients.get(thread_id)
+        if thread_client is None:
+            thread_client = self._async_thread_clients.setdefault(
+                thread_id, self._get_async_client().get_chat_thread_client(thread_id)
+            )
+        return thread_client
+    
     def create_thread(
         self,
         topic: str,
@@ -336,13 +556,11 @@ class ACSChatService:
         Returns:
             Thread info with thread_id
         """
-        from azure.communication.chat import ChatParticipant
-        
         chat_participants = []
         if participants:
             for p in participants:
-                chat_participants.append(ChatParticipant(
-                    identifier=CommunicationUserIdentifier(p['id']),
+                chat_participants.append(self._participant_cls(
+                    identifier=self._identifier_cls(p['id']),
                     display_name=p.get('display_name', 'User')
                 ))
         
@@ -353,7 +571,7 @@ class ACSChatService:
             )
             
             thread_id = result.chat_thread.id
-            logger.info(f"Chat thread created: {thread_id}")
+            logger.info("Chat thread created: %s", thread_id)
             
             return {
                 "thread_id": thread_id,
@@ -361,7 +579,7 @@ class ACSChatService:
                 "created_on": result.chat_thread.created_on.isoformat()
             }
         except HttpResponseError as e:
-            logger.error(f"Failed to create thread: {e}")
+            logger.error("Failed to create thread: %s", e)
             raise
     
     def send_message(
@@ -384,7 +602,7 @@ class ACSChatService:
             Message info with message_id
         """
         try:
-            thread_client = self.client.get_chat_thread_client(thread_id)
+            thread_client = self._get_thread_client(thread_id)
             
             result = thread_client.send_message(
                 content=content,
@@ -392,14 +610,72 @@ class ACSChatService:
                 chat_message_type=message_type
             )
             
-            logger.info(f"Message sent: {result.id} to thread: {thread_id}")
+            logger.info("Message sent: %s to thread: %s", result.id, thread_id)
+            
+            return {
+                "message_id": result.id,
+                "thread_id": thread_id
+            }
+        except HttpResponseError as e:
+            logger.error("Failed to send message: %s", e)
+            raise
+    
+    async def send_message_async(
+        self,
+        thread_id: str,
+        content: str,
+        sender_display_name: str = "User",
+        message_type: str = "text"
+    ) -> Dict[str, Any]:
+        """
+        Send a message to a chat thread without blocking the event loop.
+        
+        Takes the same arguments and returns the same result as send_message.
+        """
+        try:
+            thread_client = self._get_async_thread_client(thread_id)
+            
+            result = await thread_client.send_message(
+                content=content,
+                sender_display_name=sender_display_name,
+                chat_message_type=message_type
+            )
+            
+            logger.info("Message sent: %s to thread: %s", result.id, thread_id)
             
             return {
                 "message_id": result.id,
                 "thread_id": thread_id
             }
         except HttpResponseError as e:
-            logger.error(f"Failed to send message: {e}")
+            logger.error("Failed to send message: %s", e)
+            raise
+    
+    def iter_messages(
+        self,
+        thread_id: str,
+        page_size: int = 50
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over messages in a chat thread, fetching pages on demand.
+        
+        Messages are yielded as each page arrives, so callers can stop early
+        without paging through the whole thread.
+        
+        Args:
+            thread_id: Thread ID
+            page_size: Messages requested per page
+        
+        Yields:
+            Message dicts
+        """
+        try:
+            thread_client = self._get_thread_client(thread_id)
+            messages = thread_client.list_messages(results_per_page=page_size)
+            
+            yield from map(_message_to_dict, messages)
+        except HttpResponseError as e:
+            logger.error("Failed to list messages: %s", e)
             raise
     
     def list_messages(
@@ -417,24 +693,7 @@ class ACSChatService:
         Returns:
             List of messages
         """
-        try:
-            thread_client = self.client.get_chat_thread_client(thread_id)
-            messages = thread_client.list_messages(results_per_page=max_results)
-            
-            result = []
-            for message in messages:
-                result.append({
-                    "id": message.id,
-                    "type": message.type,
-                    "content": message.content.message if message.content else None,
-                    "sender_id": message.sender_communication_identifier.properties.get('id') if message.sender_communication_identifier else None,
-                    "created_on": message.created_on.isoformat() if message.created_on else None
-                })
-            
-            return result
-        except HttpResponseError as e:
-            logger.error(f"Failed to list messages: {e}")
-            raise
+        return list(self.iter_messages(thread_id, max_results))
     
     def add_participant(
         self,
@@ -450,20 +709,18 @@ class ACSChatService:
             user_id: Communication user ID
             display_name: Display name for the user
         """
-        from azure.communication.chat import ChatParticipant
-        
         try:
-            thread_client = self.client.get_chat_thread_client(thread_id)
+            thread_client = self._get_thread_client(thread_id)
             
-            participant = ChatParticipant(
-                identifier=CommunicationUserIdentifier(user_id),
+            participant = self._participant_cls(
+                identifier=self._identifier_cls(user_id),
                 display_name=display_name
             )
             
             thread_client.add_participants([participant])
-            logger.info(f"Added participant {user_id} to thread {thread_id}")
+            logger.info("Added participant %s to thread %s", user_id, thread_id)
         except HttpResponseError as e:
-            logger.error(f"Failed to add participant: {e}")
+            logger.error("Failed to add participant: %s", e)
             raise
     
     def delete_thread(self, thread_id: str) -> None:
@@ -475,10 +732,21 @@ class ACSChatService:
         """
         try:
             self.client.delete_chat_thread(thread_id)
-            logger.info(f"Deleted thread: {thread_id}")
+            self._thread_clients.pop(thread_id, None)
+            self._async_thread_clients.pop(thread_id, None)
+            logger.info("Deleted thread: %s", thread_id)
         except HttpResponseError as e:
-            logger.error(f"Failed to delete thread: {e}")
+            logger.error("Failed to delete thread: %s", e)
             raise
+    
+    async def aclose(self) -> None:
+        """Close the async client and any async thread clients it created."""
+        for thread_client in self._async_thread_clients.values():
+            await thread_client.close()
+        self._async_thread_clients.clear()
+        if self._async_client is not None:
+            await self._async_client.close()
+            self._async_client = None
 
 
 class ACSEmailService:
@@ -499,15 +767,53 @@ class ACSEmailService:
         Args:
             config: ACS configuration object
         """
+        from azure.communication.email import EmailClient
+        
         self.config = config
+        self.client = _build_client(EmailClient, config)
         
-        if config.use_managed_identity:
-            credential = DefaultAzureCredential()
-            self.client = EmailClient(config.endpoint, credential)
-            logger.info("Email client initialized with managed identity")
-        else:
-            self.client = EmailClient.from_connection_string(config.connection_string)
-            logger.info("Email client initialized with connection string")
+        # Async client is only built when send_email_async is first used
+        self._async_client = None
+    
+    def _get_async_client(self) -> AsyncEmailClient:
+        """Get or create the async email client."""
+        if self._async_client is None:
+            from azure.communication.email.aio import EmailClient as AsyncEmailClient
+            self._async_client = _build_async_client(AsyncEmailClient, self.config)
+        return self._async_client
+    
+    @staticmethod
+    def _build_message(
+        sender: str,
+        recipients: List[str],
+        subject: str,
+        body_html: str = None,
+        body_plain: str = None,
+        cc: List[str] = None,
+        bcc: List[str] = None,
+        reply_to: str = None
+    ) -> Dict[str, Any]:
+        """Build the email message payload shared by the sync and async senders."""
+        content = {"subject": subject}
+        if body_html:
+            content["html"] = body_html
+        if body_plain:
+            content["plainText"] = body_plain
+        
+        message = {
+            "senderAddress": sender,
+            "recipients": {
+                "to": [{"address": addr} for addr in recipients],
+                "cc": [{"address": addr} for addr in cc or _EMPTY],
+                "bcc": [{"address": addr} for addr in bcc or _EMPTY]
+            },
+            "content": content
+        }
+        
+        if reply_to:
+            message["replyTo"] = [{"address": reply_to}]
+        
+        return message
     
     def send_email(
         self,
@@ -537,45 +843,63 @@ class ACSEmailService:
             Send result with operation ID
         """
         try:
-            # Build recipient lists
-            to_recipients = [{"address": addr} for addr in recipients]
-            cc_recipients = [{"address": addr} for addr in (cc or [])]
-            bcc_recipients = [{"address": addr} for addr in (bcc or [])]
-            
-            # Build message
-            message = {
-                "senderAddress": sender,
-                "recipients": {
-                    "to": to_recipients,
-                    "cc": cc_recipients,
-                    "bcc": bcc_recipients
-                },
-                "content": {
-                    "subject": subject
-                }
-            }
-            
-            if body_html:
-                message["content"]["html"] = body_html
-            if body_plain:
-                message["content"]["plainText"] = body_plain
-            
-            if reply_to:
-                message["replyTo"] = [{"address": reply_to}]
+            message = self._build_message(
+                sender, recipients, subject, body_html, body_plain, cc, bcc, reply_to
+            )
             
             # Send email
             poller = self.client.begin_send(message)
             result = poller.result()
             
-            logger.info(f"Email sent: {result['id']}")
+            logger.info("Email sent: %s", result['id'])
             
             return {
                 "operation_id": result["id"],
                 "status": result["status"]
             }
         except HttpResponseError as e:
-            logger.error(f"Failed to send email: {e}")
+            logger.error("Failed to send email: %s", e)
             raise
+    
+    async def send_email_async(
+        self,
+        sender: str,
+        recipients: List[str],
+        subject: str,
+        body_html: str = None,
+        body_plain: str = None,
+        cc: List[str] = None,
+        bcc: List[str] = None,
+        reply_to: str = None
+    ) -> Dict[str, Any]:
+        """
+        Send an email without blocking the event loop.
+        
+        Takes the same arguments and returns the same result as send_email.
+        """
+        try:
+            message = self._build_message(
+                sender, recipients, subject, body_html, body_plain, cc, bcc, reply_to
+            )
+            
+            poller = await self._get_async_client().begin_send(message)
+            result = await poller.result()
+            
+            logger.info("Email sent: %s", result['id'])
+            
+            return {
+                "operation_id": result["id"],
+                "status": result["status"]
+            }
+        except HttpResponseError as e:
+            logger.error("Failed to send email: %s", e)
+            raise
+    
+    async def aclose(self) -> None:
+        """Close the async client, if one was created."""
+        if self._async_client is not None:
+            await self._async_client.close()
+            self._async_client = None
 
 
 # ============================================================================
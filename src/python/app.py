@@ -12,21 +12,30 @@ It demonstrates production-ready patterns including:
 Usage:
     flask run --host=0.0.0.0 --port=5000
     
-    Or with gunicorn:
-    gunicorn -w 4 -b 0.0.0.0:5000 app:app
+    Or with gunicorn (gunicorn.conf.py in this directory is loaded automatically;
+    it runs threaded workers and warms up the SDK clients in each one):
+    gunicorn app:app
 """
 
 import os
+import time
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import timedelta
-from functools import wraps
+from functools import lru_cache, partial, wraps
+import orjson
+import requests
+from requests.adapters import HTTPAdapter
 from flask import Flask, request, jsonify
-from flask_cors import CORS
+from flask.json.provider import JSONProvider
+from pydantic import BaseModel, Field, ValidationError
+from azure.core.pipeline.transport import RequestsTransport
 from azure.identity import DefaultAzureCredential
 from azure.keyvault.secrets import SecretClient
-from azure.communication.identity import CommunicationIdentityClient
+from azure.communication.identity import CommunicationIdentityClient, CommunicationUserIdentifier
 from azure.communication.sms import SmsClient
-from azure.core.exceptions import HttpResponseError, ResourceNotFoundError
+from azure.core.exceptions import AzureError, HttpResponseError, ResourceNotFoundError
 
 # Configure logging
 logging.basicConfig(
@@ -35,54 +44,174 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+
+class OrjsonProvider(JSONProvider):
+    """Flask JSON provider backed by orjson, used by jsonify() and request.get_json()."""
+    
+    def dumps(self, obj, **kwargs) -> str:
+        return orjson.dumps(obj).decode()
+    
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+    
+    def response(self, *args, **kwargs):
+        # Write orjson's bytes straight into the response body
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(orjson.dumps(obj), mimetype="application/json")
+
+
 # Initialize Flask app
 app = Flask(__name__)
-CORS(app)
+app.json = OrjsonProvider(app)
 
 # Configuration
 ACS_ENDPOINT = os.environ.get("ACS_ENDPOINT")
 KEY_VAULT_NAME = os.environ.get("KEY_VAULT_NAME")
 
-# Global clients (lazy initialization)
+# Connections kept per host; sized for concurrent requests per worker
+HTTP_POOL_MAXSIZE = 50
+
+# Cached access tokens are refreshed this many seconds before they expire
+TOKEN_REFRESH_MARGIN_SECONDS = 300
+
+# Token scope requested by the ACS SDK clients
+ACS_TOKEN_SCOPE = "https://communication.azure.com//.default"
+
+# Key Vault secrets are cached in-process for up to this many seconds
+SECRET_CACHE_TTL_SECONDS = 600
+
+# CORS policy, applied to every response (allows any origin)
+_CORS_HEADERS = {
+    "Access-Control-Allow-Origin": "*",
+    "Access-Control-Allow-Methods": "GET,POST,DELETE,OPTIONS",
+    "Access-Control-Allow-Headers": "Content-Type,Authorization"
+}
+
+# Recipients per ACS SMS send request; larger bulk sends are split and sent concurrently
+SMS_BATCH_SIZE = 100
+
+# Global clients (lazy initialization). Getters re-check under _init_lock so
+# concurrent first requests build one instance; it is re-entrant because the
+# client getters call get_credential()/get_transport() while holding it.
+_init_lock = threading.RLock()
+_transport = None
 _credential = None
+_secret_client = None
 _identity_client = None
 _sms_client = None
 
+# Worker threads for fan-out I/O. Never larger than the connection pool, so
+# tasks do not wait on each other for a connection; threads start on first use.
+_io_pool = ThreadPoolExecutor(max_workers=min(32, HTTP_POOL_MAXSIZE), thread_name_prefix="acs-io")
+
+
+class CachedCredential:
+    """
+    Token credential wrapper that reuses access tokens until shortly before expiry.
+    
+    Each SDK client has its own bearer-token policy; sharing this wrapper lets
+    all of them reuse one token per scope instead of each asking the
+    underlying credential (and possibly IMDS) for its own.
+    """
+    
+    def __init__(self, inner):
+        self._inner = inner
+        self._cache = {}
+        self._lock = threading.Lock()
+    
+    @staticmethod
+    def _is_fresh(token) -> bool:
+        return token is not None and time.time() + TOKEN_REFRESH_MARGIN_SECONDS < token.expires_on
+    
+    def get_token(self, *scopes, **kwargs):
+        """Return a cached token for the scopes, fetching a new one when needed."""
+        # Claims challenges and tenant overrides must always reach the credential
+        if kwargs.get("claims") or kwargs.get("tenant_id"):
+            return self._inner.get_token(*scopes, **kwargs)
+        
+        key = (scopes, tuple(sorted(kwargs.items())))
+        token = self._cache.get(key)
+        if not self._is_fresh(token):
+            with self._lock:
+                token = self._cache.get(key)
+                if not self._is_fresh(token):
+                    token = self._inner.get_token(*scopes, **kwargs)
+                    self._cache[key] = token
+        return token
+
 
 def get_credential():
-    """Get or create Azure credential (managed identity)."""
+    """Get or create Azure credential (managed identity) with token caching."""
     global _credential
     if _credential is None:
-        _credential = DefaultAzureCredential()
+        with _init_lock:
+            if _credential is None:
+                _credential = CachedCredential(DefaultAzureCredential())
     return _credential
 
 
-def get_secret(secret_name: str) -> str:
-    """Retrieve a secret from Key Vault."""
-    if not KEY_VAULT_NAME:
-        raise ValueError("KEY_VAULT_NAME environment variable not set")
-    
-    vault_url = f"https://{KEY_VAULT_NAME}.vault.azure.net"
-    client = SecretClient(vault_url=vault_url, credential=get_credential())
+def get_transport():
+    """Get or create the HTTP transport shared by all SDK clients."""
+    global _transport
+    if _transport is None:
+        with _init_lock:
+            if _transport is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=HTTP_POOL_MAXSIZE, pool_maxsize=HTTP_POOL_MAXSIZE)
+                session.mount("https://", adapter)
+                # Clients must not close the session the others are using
+                _transport = RequestsTransport(session=session, session_owner=False)
+    return _transport
+
+
+def _get_secret_client():
+    """Get or create the Key Vault secret client."""
+    global _secret_client
+    if _secret_client is None:
+        with _init_lock:
+            if _secret_client is None:
+                _secret_client = SecretClient(
+                    vault_url=f"https://{KEY_VAULT_NAME}.vault.azure.net",
+                    credential=get_credential(),
+                    transport=get_transport()
+                )
+    return _secret_client
+
+
+@lru_cache(maxsize=128)
+def _get_secret_cached(secret_name: str, ttl_window: int) -> str:
+    """Fetch a secret from Key Vault; ttl_window in the cache key expires entries."""
+    client = _get_secret_client()
     
     try:
         secret = client.get_secret(secret_name)
         return secret.value
     except ResourceNotFoundError:
-        logger.error(f"Secret not found: {secret_name}")
+        logger.error("Secret not found: %s", secret_name)
         raise
 
 
+def get_secret(secret_name: str) -> str:
+    """Retrieve a secret from Key Vault, cached for SECRET_CACHE_TTL_SECONDS."""
+    if not KEY_VAULT_NAME:
+        raise ValueError("KEY_VAULT_NAME environment variable not set")
+    
+    return _get_secret_cached(secret_name, int(time.time() // SECRET_CACHE_TTL_SECONDS))
+
+
 def get_identity_client():
     """Get or create identity client."""
     global _identity_client
     if _identity_client is None:
         if not ACS_ENDPOINT:
             raise ValueError("ACS_ENDPOINT environment variable not set")
-        _identity_client = CommunicationIdentityClient(
-            ACS_ENDPOINT,
-            get_credential()
-        )
+        with _init_lock:
+            if _identity_client is None:
+                _identity_client = CommunicationIdentityClient(
+                    ACS_ENDPOINT,
+                    get_credential(),
+                    transport=get_transport()
+                )
     return _identity_client
 
 
@@ -92,44 +221,122 @@ def get_sms_client():
     if _sms_client is None:
         if not ACS_ENDPOINT:
             raise ValueError("ACS_ENDPOINT environment variable not set")
-        _sms_client = SmsClient(ACS_ENDPOINT, get_credential())
+        with _init_lock:
+            if _sms_client is None:
+                _sms_client = SmsClient(ACS_ENDPOINT, get_credential(), transport=get_transport())
     return _sms_client
 
 
+def warmup():
+    """
+    Build the shared SDK clients and prime the token cache before traffic arrives.
+    
+    Called from gunicorn's post_fork hook so each worker creates its own clients
+    after forking. Failures are logged rather than raised; requests will build
+    the clients lazily as usual.
+    """
+    try:
+        get_identity_client()
+        get_sms_client()
+        get_credential().get_token(ACS_TOKEN_SCOPE)
+        logger.info("SDK clients warmed up")
+    except Exception as e:
+        logger.warning("Warm-up skipped: %s", e)
+
+
+# ============================================================================
+# Request Models
+# ============================================================================
+
+class SmsRequest(BaseModel):
+    """Request body for /api/v1/sms/send."""
+    from_: str = Field(alias="from")
+    to: str | list[str]
+    message: str
+    enable_delivery_report: bool = True
+    tag: str | None = None
+
+
+class BulkSmsRequest(BaseModel):
+    """Request body for /api/v1/sms/send-bulk."""
+    from_: str = Field(alias="from")
+    to: list[str]
+    message: str
+    enable_delivery_report: bool = True
+
+
 def handle_errors(f):
     """Decorator for consistent error handling."""
     @wraps(f)
     def decorated_function(*args, **kwargs):
         try:
             return f(*args, **kwargs)
+        except ValidationError as e:
+            # Checked before ValueError, which pydantic's ValidationError subclasses
+            # Submitted values (phone numbers, message text) are kept out of the
+            # log and the response: str(e) and the "input" key would echo them
+            logger.error("Request validation error: %d invalid field(s)", e.error_count())
+            return jsonify({
+                "error": "Invalid request body",
+                "type": "validation_error",
+                "details": [
+                    {k: v for k, v in error.items() if k != "input"}
+                    for error in e.errors(include_url=False, include_context=False)
+                ]
+            }), 400
         except ValueError as e:
-            logger.error(f"Validation error: {e}")
+            logger.error("Validation error: %s", e)
             return jsonify({"error": str(e), "type": "validation_error"}), 400
         except HttpResponseError as e:
-            logger.error(f"ACS error: {e}")
+            logger.error("ACS error: %s", e)
             return jsonify({
                 "error": str(e),
                 "type": "acs_error",
                 "status_code": e.status_code
             }), e.status_code or 500
         except Exception as e:
-            logger.exception(f"Unexpected error: {e}")
+            logger.exception("Unexpected error: %s", e)
             return jsonify({"error": "Internal server error", "type": "internal_error"}), 500
     return decorated_function
 
 
+# ============================================================================
+# CORS
+# ============================================================================
+
+@app.before_request
+def cors_preflight():
+    """Answer CORS preflight requests without dispatching to a view."""
+    # Unmatched paths have no url_rule; let Flask return its usual 404/405
+    if request.method == "OPTIONS" and request.url_rule is not None:
+        return "", 204, _CORS_HEADERS
+
+
+@app.after_request
+def add_cors_headers(response):
+    """Attach the fixed CORS headers to every response."""
+    response.headers.update(_CORS_HEADERS)
+    return response
+
+
 # ============================================================================
 # Health Endpoints
 # ============================================================================
 
+# The liveness payload never changes, so it is serialized once at import
+_HEALTH_BODY = orjson.dumps({
+    "status": "healthy",
+    "service": "acs-api",
+    "version": "1.0.0"
+})
+_HEALTH_HEADERS = {"Cache-Control": "no-store"}
+
+
 @app.route("/health", methods=["GET"])
 def health():
     """Health check endpoint for load balancers and orchestrators."""
-    return jsonify({
-        "status": "healthy",
-        "service": "acs-api",
-        "version": "1.0.0"
-    })
+    # A fresh Response per probe: after_request hooks mutate its headers
+    return app.response_class(_HEALTH_BODY, mimetype="application/json", headers=_HEALTH_HEADERS)
 
 
 @app.route("/health/ready", methods=["GET"])
@@ -172,7 +379,7 @@ def create_user():
     scopes = data.get("scopes", ["voip", "chat"])
     expires_hours = data.get("token_expires_hours", 24)
     
-    if expires_hours < 1 or expires_hours > 24:
+    if not (1 <= expires_hours <= 24):
         return jsonify({"error": "token_expires_hours must be between 1 and 24"}), 400
     
     client = get_identity_client()
@@ -182,7 +389,7 @@ def create_user():
         token_expires_in=timedelta(hours=expires_hours)
     )
     
-    logger.info(f"Created user: {user.properties['id'][:20]}...")
+    logger.info("Created user: %.20s...", user.properties["id"])
     
     return jsonify({
         "user_id": user.properties["id"],
@@ -208,8 +415,6 @@ def get_token(user_id: str):
         "expires_on": "2024-01-01T00:00:00Z"
     }
     """
-    from azure.communication.identity import CommunicationUserIdentifier
-    
     data = request.get_json() or {}
     scopes = data.get("scopes", ["voip", "chat"])
     
@@ -218,7 +423,7 @@ def get_token(user_id: str):
     
     token_response = client.get_token(user, scopes=scopes)
     
-    logger.info(f"Issued token for user: {user_id[:20]}...")
+    logger.info("Issued token for user: %.20s...", user_id)
     
     return jsonify({
         "token": token_response.token,
@@ -230,17 +435,14 @@ def get_token(user_id: str):
 @handle_errors
 def delete_user(user_id: str):
     """Delete a communication user."""
-    from azure.communication.identity import CommunicationUserIdentifier
-    
     client = get_identity_client()
     user = CommunicationUserIdentifier(user_id)
     
-    # Revoke tokens first
-    client.revoke_tokens(user)
-    # Then delete user
+    # Deleting the identity also revokes all of its tokens, so no separate
+    # revoke_tokens call is needed
     client.delete_user(user)
     
-    logger.info(f"Deleted user: {user_id[:20]}...")
+    logger.info("Deleted user: %.20s...", user_id)
     
     return "", 204
 
@@ -264,35 +466,34 @@ def send_sms():
         "tag": "optional-tracking-tag"
     }
     
+    "to" may also be a list of numbers; the response describes the first.
+    
     Returns:
     {
         "message_id": "...",
         "successful": true
     }
     """
-    data = request.get_json()
+    body = request.get_data(cache=False)
     
-    if not data:
+    if not body:
         return jsonify({"error": "Request body required"}), 400
     
-    required_fields = ["from", "to", "message"]
-    for field in required_fields:
-        if field not in data:
-            return jsonify({"error": f"Missing required field: {field}"}), 400
+    req = SmsRequest.model_validate_json(body)
     
     client = get_sms_client()
     
     response = client.send(
-        from_=data["from"],
-        to=data["to"],
-        message=data["message"],
-        enable_delivery_report=data.get("enable_delivery_report", True),
-        tag=data.get("tag")
+        from_=req.from_,
+        to=req.to,
+        message=req.message,
+        enable_delivery_report=req.enable_delivery_report,
+        tag=req.tag
     )
     
     result = response[0]
     
-    logger.info(f"SMS sent: {result.message_id} to {data['to']}")
+    logger.info("SMS sent: %s to %s", result.message_id, req.to)
     
     return jsonify({
         "message_id": result.message_id,
@@ -302,6 +503,18 @@ def send_sms():
     })
 
 
+def _bulk_sms_results(response) -> list:
+    """Convert an SmsClient.send response into the bulk endpoint's result dicts."""
+    return [
+        {
+            "message_id": result.message_id,
+            "to": result.to,
+            "successful": result.successful
+        }
+        for result in response
+    ]
+
+
 @app.route("/api/v1/sms/send-bulk", methods=["POST"])
 @handle_errors
 def send_bulk_sms():
@@ -322,35 +535,59 @@ def send_bulk_sms():
             {"message_id": "...", "to": "+1122334455", "successful": true}
         ]
     }
+    
+    Recipient lists larger than SMS_BATCH_SIZE are sent as concurrent batches.
+    If some batches fail, the response is 207 and the recipients of each failed
+    batch are listed with "successful": false and an "error" message, so a
+    retry can target only those numbers.
     """
-    data = request.get_json()
+    body = request.get_data(cache=False)
     
-    if not data:
+    if not body:
         return jsonify({"error": "Request body required"}), 400
     
-    if "to" not in data or not isinstance(data["to"], list):
-        return jsonify({"error": "'to' must be a list of phone numbers"}), 400
+    req = BulkSmsRequest.model_validate_json(body)
     
     client = get_sms_client()
     
-    response = client.send(
-        from_=data["from"],
-        to=data["to"],
-        message=data["message"],
-        enable_delivery_report=data.get("enable_delivery_report", True)
+    send = partial(
+        client.send,
+        from_=req.from_,
+        message=req.message,
+        enable_delivery_report=req.enable_delivery_report
     )
-    
+    recipients = req.to
+    batches = [recipients[i:i + SMS_BATCH_SIZE] for i in range(0, len(recipients), SMS_BATCH_SIZE)]
+    
+    if len(batches) <= 1:
+        # A single request succeeds or fails as a unit
+        results = _bulk_sms_results(send(to=recipients))
+        logger.info("Bulk SMS sent to %s recipients", len(results))
+        return jsonify({"results": results})
+    
+    # Each batch's outcome is collected separately so a failed batch does not
+    # hide the messages that other batches already sent
+    futures = [_io_pool.submit(send, to=batch) for batch in batches]
     results = []
-    for result in response:
-        results.append({
-            "message_id": result.message_id,
-            "to": result.to,
-            "successful": result.successful
-        })
-    
-    logger.info(f"Bulk SMS sent to {len(results)} recipients")
-    
-    return jsonify({"results": results})
+    errors = []
+    for batch, future in zip(batches, futures):
+        try:
+            results.extend(_bulk_sms_results(future.result()))
+        except AzureError as e:
+            logger.error("Bulk SMS batch of %s recipients failed: %s", len(batch), e)
+            errors.append(e)
+            results.extend(
+                {"message_id": None, "to": number, "successful": False, "error": str(e)}
+                for number in batch
+            )
+    
+    if len(errors) == len(batches):
+        # Nothing was sent, so report the failure as the single-request path does
+        raise errors[0]
+    
+    logger.info("Bulk SMS: %s batches sent, %s failed", len(batches) - len(errors), len(errors))
+    
+    return jsonify({"results": results}), 207 if errors else 200
 
 
 # ============================================================================
@@ -9,12 +9,14 @@ Functions handle:
 """
 
 import logging
-import json
+import orjson
 import azure.functions as func
 from azure.cosmos import CosmosClient
 from azure.identity import DefaultAzureCredential
 import os
-from datetime import datetime
+import time
+from datetime import datetime, timezone
+from functools import lru_cache
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -23,11 +25,54 @@ logger = logging.getLogger(__name__)
 COSMOS_ENDPOINT = os.environ.get("COSMOS_DB_ENDPOINT")
 COSMOS_DATABASE = "acs-database"
 
+# Cosmos DB transactional batches are limited to 100 operations
+COSMOS_BATCH_LIMIT = 100
 
+
+# (epoch second, ISO string) of the last formatted timestamp. Replaced as a
+# whole tuple, so concurrent readers never see a mismatched pair.
+_now_cache = (0, "")
+
+
+def _now_iso() -> str:
+    """Current UTC time as an ISO 8601 string, formatted at most once per second."""
+    global _now_cache
+    now = int(time.time())
+    cached_second, cached_iso = _now_cache
+    if now != cached_second:
+        cached_iso = datetime.fromtimestamp(now, timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+        _now_cache = (now, cached_iso)
+    return cached_iso
+
+
+@lru_cache(maxsize=1)
 def get_cosmos_client():
-    """Get Cosmos DB client with managed identity."""
-    credential = DefaultAzureCredential()
-    return CosmosClient(COSMOS_ENDPOINT, credential)
+    """
+    Get the Cosmos DB client with managed identity.
+    
+    Created once per Functions worker and reused across invocations so the
+    credential's token cache and the client's connection pool are shared.
+    """
+    return CosmosClient(COSMOS_ENDPOINT, DefaultAzureCredential())
+
+
+@lru_cache(maxsize=8)
+def get_container(name: str):
+    """Get a cached container client in the ACS database."""
+    return get_cosmos_client().get_database_client(COSMOS_DATABASE).get_container_client(name)
+
+
+def upsert_batch(container, items: list, partition_key: str):
+    """
+    Upsert items sharing a partition key with transactional batches.
+    
+    One round trip per COSMOS_BATCH_LIMIT items instead of one per item.
+    """
+    for start in range(0, len(items), COSMOS_BATCH_LIMIT):
+        container.execute_item_batch(
+            [("upsert", (item,)) for item in items[start:start + COSMOS_BATCH_LIMIT]],
+            partition_key=partition_key
+        )
 
 
 app = func.FunctionApp()
@@ -54,7 +99,7 @@ def process_sms_received(event: func.EventGridEvent):
         }
     }
     """
-    logger.info(f"SMS Received Event: {event.id}")
+    logger.info("SMS Received Event: %s", event.id)
     
     try:
         data = event.get_json()
@@ -67,16 +112,14 @@ def process_sms_received(event: func.EventGridEvent):
             "to": data.get("to"),
             "message": data.get("message"),
             "receivedAt": data.get("receivedTimestamp"),
-            "processedAt": datetime.utcnow().isoformat()
+            "processedAt": _now_iso()
         }
         
-        logger.info(f"SMS from {sms_data['from']} to {sms_data['to']}")
+        logger.info("SMS from %s to %s", sms_data["from"], sms_data["to"])
         
         # Store in Cosmos DB for audit/history
         if COSMOS_ENDPOINT:
-            client = get_cosmos_client()
-            database = client.get_database_client(COSMOS_DATABASE)
-            container = database.get_container_client("call-logs")
+            container = get_container("call-logs")
             
             container.upsert_item({
                 "id": event.id,
@@ -86,7 +129,7 @@ def process_sms_received(event: func.EventGridEvent):
                 "data": sms_data
             })
             
-            logger.info(f"SMS logged to Cosmos DB: {event.id}")
+            logger.info("SMS logged to Cosmos DB: %s", event.id)
         
         # TODO: Add business logic here
         # - Auto-reply
@@ -94,7 +137,7 @@ def process_sms_received(event: func.EventGridEvent):
         # - Trigger workflow
         
     except Exception as e:
-        logger.exception(f"Error processing SMS event: {e}")
+        logger.exception("Error processing SMS event: %s", e)
         raise
 
 
@@ -110,22 +153,19 @@ def process_chat_event(event: func.EventGridEvent):
     - Microsoft.Communication.ChatParticipantAdded
     """
     event_type = event.event_type
-    logger.info(f"Chat Event: {event_type}, ID: {event.id}")
+    logger.info("Chat Event: %s, ID: %s", event_type, event.id)
     
     try:
         data = event.get_json()
         
-        if event_type == "Microsoft.Communication.ChatMessageReceived":
-            process_chat_message(event.id, data)
-        elif event_type == "Microsoft.Communication.ChatThreadCreated":
-            process_thread_created(event.id, data)
-        elif event_type == "Microsoft.Communication.ChatParticipantAdded":
-            process_participant_added(event.id, data)
+        handler = _CHAT_DISPATCH.get(event_type)
+        if handler:
+            handler(event.id, data)
         else:
-            logger.warning(f"Unknown chat event type: {event_type}")
+            logger.warning("Unknown chat event type: %s", event_type)
             
     except Exception as e:
-        logger.exception(f"Error processing chat event: {e}")
+        logger.exception("Error processing chat event: %s", e)
         raise
 
 
@@ -135,12 +175,10 @@ def process_chat_message(event_id: str, data: dict):
     sender_id = data.get("senderId")
     message = data.get("messageBody")
     
-    logger.info(f"Chat message in thread {thread_id[:20]}... from {sender_id[:20]}...")
+    logger.info("Chat message in thread %.20s... from %.20s...", thread_id, sender_id)
     
     if COSMOS_ENDPOINT:
-        client = get_cosmos_client()
-        database = client.get_database_client(COSMOS_DATABASE)
-        container = database.get_container_client("chat-history")
+        container = get_container("chat-history")
         
         container.upsert_item({
             "id": event_id,
@@ -148,10 +186,10 @@ def process_chat_message(event_id: str, data: dict):
             "senderId": sender_id,
             "message": message,
             "timestamp": data.get("transactionId"),
-            "processedAt": datetime.utcnow().isoformat()
+            "processedAt": _now_iso()
         })
         
-        logger.info(f"Chat message logged: {event_id}")
+        logger.info("Chat message logged: %s", event_id)
 
 
 def process_thread_created(event_id: str, data: dict):
@@ -159,7 +197,7 @@ def process_thread_created(event_id: str, data: dict):
     thread_id = data.get("threadId")
     created_by = data.get("createdBy")
     
-    logger.info(f"Chat thread created: {thread_id[:20]}... by {created_by[:20]}...")
+    logger.info("Chat thread created: %.20s... by %.20s...", thread_id, created_by)
 
 
 def process_participant_added(event_id: str, data: dict):
@@ -168,7 +206,32 @@ def process_participant_added(event_id: str, data: dict):
     participants = data.get("participantsAdded", [])
     
     for p in participants:
-        logger.info(f"Participant added to {thread_id[:20]}...: {p.get('id', '')[:20]}...")
+        logger.info("Participant added to %.20s...: %.20s...", thread_id, p.get("id", ""))
+    
+    if COSMOS_ENDPOINT and participants:
+        container = get_container("chat-history")
+        
+        processed_at = _now_iso()
+        upsert_batch(container, [
+            {
+                "id": f"{event_id}-{i}",
+                "threadId": thread_id,  # Partition key
+                "type": "participant_added",
+                "participant": p,
+                "processedAt": processed_at
+            }
+            for i, p in enumerate(participants)
+        ], thread_id)
+        
+        logger.info("%s participants logged: %s", len(participants), event_id)
+
+
+# Chat event type -> handler, used by process_chat_event
+_CHAT_DISPATCH = {
+    "Microsoft.Communication.ChatMessageReceived": process_chat_message,
+    "Microsoft.Communication.ChatThreadCreated": process_thread_created,
+    "Microsoft.Communication.ChatParticipantAdded": process_participant_added
+}
 
 
 @app.function_name("process_recording_event")
@@ -179,7 +242,7 @@ def process_recording_event(event: func.EventGridEvent):
     
     Handles event type: Microsoft.Communication.RecordingFileStatusUpdated
     """
-    logger.info(f"Recording Event: {event.id}")
+    logger.info("Recording Event: %s", event.id)
     
     try:
         data = event.get_json()
@@ -191,7 +254,7 @@ def process_recording_event(event: func.EventGridEvent):
             content_location = chunk.get("contentLocation")
             delete_location = chunk.get("deleteLocation")
             
-            logger.info(f"Recording available at: {content_location}")
+            logger.info("Recording available at: %s", content_location)
             
             # TODO: Download and process recording
             # - Transcription
@@ -199,23 +262,38 @@ def process_recording_event(event: func.EventGridEvent):
             # - Compliance archiving
         
         if COSMOS_ENDPOINT:
-            client = get_cosmos_client()
-            database = client.get_database_client(COSMOS_DATABASE)
-            container = database.get_container_client("call-logs")
+            container = get_container("call-logs")
             
-            container.upsert_item({
+            call_id = data.get("serverCallId")
+            processed_at = _now_iso()
+            
+            # One summary document plus one document per chunk, written in
+            # the same call-id partition so they can be batched together
+            items = [{
                 "id": event.id,
-                "callId": data.get("serverCallId"),  # Partition key
+                "callId": call_id,  # Partition key
                 "type": "recording",
                 "status": "available",
-                "chunks": recording_chunks,
-                "processedAt": datetime.utcnow().isoformat()
-            })
+                "chunkCount": len(recording_chunks),
+                "processedAt": processed_at
+            }]
+            items.extend(
+                {
+                    "id": f"{event.id}-{i}",
+                    "callId": call_id,
+                    "type": "recording_chunk",
+                    "recordingId": event.id,
+                    "chunk": chunk,
+                    "processedAt": processed_at
+                }
+                for i, chunk in enumerate(recording_chunks)
+            )
+            upsert_batch(container, items, call_id)
             
-            logger.info(f"Recording event logged: {event.id}")
+            logger.info("Recording event logged: %s", event.id)
             
     except Exception as e:
-        logger.exception(f"Error processing recording event: {e}")
+        logger.exception("Error processing recording event: %s", e)
         raise
 
 
@@ -229,7 +307,7 @@ def health_check(timer: func.TimerRequest):
     logger.info("Running health check...")
     
     health_status = {
-        "timestamp": datetime.utcnow().isoformat(),
+        "timestamp": _now_iso(),
         "cosmos_db": "unknown",
         "key_vault": "unknown"
     }
@@ -237,15 +315,15 @@ def health_check(timer: func.TimerRequest):
     # Check Cosmos DB
     if COSMOS_ENDPOINT:
         try:
-            client = get_cosmos_client()
-            database = client.get_database_client(COSMOS_DATABASE)
-            # Light read operation
-            list(database.list_containers(max_item_count=1))
+            database = get_cosmos_client().get_database_client(COSMOS_DATABASE)
+            # Light read operation: fetch the first page and stop at one item
+            next(iter(database.list_containers(max_item_count=1)), None)
             health_status["cosmos_db"] = "healthy"
         except Exception as e:
             health_status["cosmos_db"] = f"unhealthy: {str(e)}"
-            logger.error(f"Cosmos DB health check failed: {e}")
+            logger.error("Cosmos DB health check failed: %s", e)
     else:
         health_status["cosmos_db"] = "not configured"
     
-    logger.info(f"Health check complete: {json.dumps(health_status)}")
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("Health check complete: %s", orjson.dumps(health_status).decode())
@@ -0,0 +1,36 @@
+"""
+Gunicorn configuration for the ACS Flask API.
+
+Gunicorn loads this file automatically when started from this directory:
+    gunicorn app:app
+
+The API spends most of each request waiting on ACS and Key Vault, so workers
+use threads (gthread) to overlap those waits over the shared connection pool.
+Tune with WEB_CONCURRENCY (worker processes) and GUNICORN_THREADS.
+
+Each handler makes a single blocking ACS call, so a worker overlaps up to
+`threads` calls at once. To overlap more, raise GUNICORN_THREADS (up to
+app.HTTP_POOL_MAXSIZE) before moving to an async framework. The async ACS
+clients are shown in acs_sdk_sample.py for code that fans out many calls
+per request.
+"""
+
+import os
+import multiprocessing
+
+bind = f"0.0.0.0:{os.environ.get('PORT', '5000')}"
+worker_class = "gthread"
+workers = int(os.environ.get("WEB_CONCURRENCY", multiprocessing.cpu_count() * 2 + 1))
+# Keep threads at or below app.HTTP_POOL_MAXSIZE so requests never wait on the pool
+threads = int(os.environ.get("GUNICORN_THREADS", "8"))
+keepalive = 75
+
+# Import the app once in the master and fork it; SDK clients are not created
+# at import time, so every worker builds its own in post_fork below
+preload_app = True
+
+
+def post_fork(server, worker):
+    """Warm up the SDK clients in each worker so the first request is not slow."""
+    from app import warmup
+    warmup()
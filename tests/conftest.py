@@ -0,0 +1,10 @@
+"""
+Shared pytest configuration.
+
+Makes the sample applications in src/python importable from the tests.
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src", "python"))
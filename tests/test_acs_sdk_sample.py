@@ -0,0 +1,28 @@
+"""
+Unit tests for the ACS SDK samples (src/python/acs_sdk_sample.py).
+"""
+
+import asyncio
+
+import acs_sdk_sample as sample
+
+
+def test_aclose_shared_credential_allows_a_new_event_loop():
+    async def use_credential():
+        credential = sample._shared_async_credential()
+        await sample.aclose_shared_credential()
+        return credential
+    
+    first = asyncio.run(use_credential())
+    second = asyncio.run(use_credential())
+    
+    assert first is not second
+    assert sample._shared_async_credential.cache_info().currsize == 0
+
+
+def test_aclose_shared_credential_without_credential_is_noop():
+    sample._shared_async_credential.cache_clear()
+    
+    asyncio.run(sample.aclose_shared_credential())
+    
+    assert sample._shared_async_credential.cache_info().currsize == 0
@@ -0,0 +1,108 @@
+"""
+Unit tests for the ACS Flask API (src/python/app.py).
+
+ACS clients are replaced with in-memory fakes, so no Azure resources are needed.
+"""
+
+import pytest
+from azure.core.exceptions import HttpResponseError
+
+import app as acs_app
+
+
+class FakeSendResult:
+    """Stand-in for azure.communication.sms.SmsSendResult."""
+    
+    def __init__(self, to: str):
+        self.message_id = f"msg-{to}"
+        self.to = to
+        self.successful = True
+        self.http_status_code = 202
+
+
+class FakeSmsClient:
+    """SmsClient fake that fails any batch containing a number in fail_for."""
+    
+    def __init__(self, fail_for=()):
+        self.fail_for = set(fail_for)
+        self.sent = []
+    
+    def send(self, from_, to, message, **kwargs):
+        recipients = [to] if isinstance(to, str) else list(to)
+        if self.fail_for.intersection(recipients):
+            error = HttpResponseError(message="Too Many Requests")
+            error.status_code = 429
+            raise error
+        self.sent.extend(recipients)
+        return [FakeSendResult(number) for number in recipients]
+
+
+@pytest.fixture
+def sms_client(monkeypatch):
+    client = FakeSmsClient()
+    monkeypatch.setattr(acs_app, "_sms_client", client)
+    return client
+
+
+@pytest.fixture
+def http():
+    return acs_app.app.test_client()
+
+
+def _numbers(count: int) -> list:
+    return [f"+1555{i:07d}" for i in range(count)]
+
+
+def test_send_bulk_sms_single_batch(http, sms_client):
+    numbers = _numbers(3)
+    
+    response = http.post("/api/v1/sms/send-bulk", json={"from": "+1", "to": numbers, "message": "hi"})
+    
+    assert response.status_code == 200
+    assert [r["to"] for r in response.get_json()["results"]] == numbers
+
+
+def test_send_bulk_sms_reports_failed_batch(http, sms_client):
+    numbers = _numbers(acs_app.SMS_BATCH_SIZE * 2 + 5)
+    failed_batch = numbers[acs_app.SMS_BATCH_SIZE:acs_app.SMS_BATCH_SIZE * 2]
+    sms_client.fail_for = {failed_batch[0]}
+    
+    response = http.post("/api/v1/sms/send-bulk", json={"from": "+1", "to": numbers, "message": "hi"})
+    
+    assert response.status_code == 207
+    results = response.get_json()["results"]
+    assert [r["to"] for r in results] == numbers
+    failed = [r for r in results if not r["successful"]]
+    assert [r["to"] for r in failed] == failed_batch
+    assert all(r["message_id"] is None and r["error"] for r in failed)
+    # Recipients of the other batches were sent exactly once and keep their IDs
+    assert sorted(sms_client.sent) == sorted(set(numbers) - set(failed_batch))
+    assert all(r["message_id"] == f"msg-{r['to']}" for r in results if r["successful"])
+
+
+def test_send_bulk_sms_all_batches_failed(http, sms_client):
+    numbers = _numbers(acs_app.SMS_BATCH_SIZE + 1)
+    sms_client.fail_for = {numbers[0], numbers[-1]}
+    
+    response = http.post("/api/v1/sms/send-bulk", json={"from": "+1", "to": numbers, "message": "hi"})
+    
+    assert response.status_code == 429
+    assert response.get_json()["type"] == "acs_error"
+
+
+def test_send_sms_accepts_recipient_list(http, sms_client):
+    response = http.post("/api/v1/sms/send", json={"from": "+1", "to": ["+2", "+3"], "message": "hi"})
+    
+    assert response.status_code == 200
+    assert response.get_json()["to"] == "+2"
+    assert sms_client.sent == ["+2", "+3"]
+
+
+def test_send_sms_validation_error_omits_input(http, sms_client):
+    response = http.post("/api/v1/sms/send", json={"from": "+1", "to": 5, "message": "secret text"})
+    
+    assert response.status_code == 400
+    body = response.get_json()
+    assert body["type"] == "validation_error"
+    assert all("input" not in error for error in body["details"])
+    assert "secret text" not in response.get_data(as_text=True)